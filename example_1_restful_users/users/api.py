@@ -1,4 +1,6 @@
+import logging
 import clearskies
+from wsgiref.util import setup_testing_defaults
 from users import Users
 from user import User
 
@@ -16,5 +18,17 @@ users_app = clearskies.Application(
 
 api = clearskies.contexts.wsgi(users_app)
 
+def _warm_up():
+    # Send one throwaway request through the application as the worker starts, so that clearskies does its first-run
+    # setup now instead of during the first real request.  It only asks for a single record to keep the query cheap.
+    env = {'QUERY_STRING': 'limit=1'}
+    setup_testing_defaults(env)
+    try:
+        api(env, lambda status, headers, exc_info=None: None)
+    except Exception:
+        logging.getLogger(__name__).exception('Warm-up request failed')
+
+_warm_up()
+
 def application(env, start_response):
     return api(env, start_response)
@@ -1,18 +1,26 @@
-from collections import OrderedDict
+from types import MappingProxyType
 from clearskies import Model
 from clearskies.column_types import string, email, integer, created, updated
 from clearskies.input_requirements import required, maximum_length
 
 
+_REQUIRED = required()
+_MAX_LEN_255 = maximum_length(255)
+
+
 class User(Model):
+    _columns_cache = None
+
     def __init__(self, cursor_backend, columns):
         super().__init__(cursor_backend, columns)
 
     def columns_configuration(self):
-        return OrderedDict([
-            string('name', input_requirements=[required(), maximum_length(255)]),
-            email('email', input_requirements=[required(), maximum_length(255)]),
-            integer('age'),
-            created('created'),
-            updated('updated'),
-        ])
+        if User._columns_cache is None:
+            User._columns_cache = MappingProxyType(dict([
+                string('name', input_requirements=[_REQUIRED, _MAX_LEN_255]),
+                email('email', input_requirements=[_REQUIRED, _MAX_LEN_255]),
+                integer('age'),
+                created('created'),
+                updated('updated'),
+            ]))
+        return User._columns_cache
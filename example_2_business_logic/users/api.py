@@ -1,6 +1,9 @@
+import logging
 import clearskies
+from wsgiref.util import setup_testing_defaults
 from users import Users
 from user import User
+from business_email import requests_session
 
 api = clearskies.contexts.wsgi(clearskies.Application(
     clearskies.handlers.RestfulAPI,
@@ -12,7 +15,20 @@ api = clearskies.contexts.wsgi(clearskies.Application(
         'default_sort_column': 'name',
         'authentication': clearskies.authentication.public(),
     },
+    bindings={'requests': requests_session},
 ))
 
+def _warm_up():
+    # Send one throwaway request through the application as the worker starts, so that clearskies does its first-run
+    # setup now instead of during the first real request.  It only asks for a single record to keep the query cheap.
+    env = {'QUERY_STRING': 'limit=1'}
+    setup_testing_defaults(env)
+    try:
+        api(env, lambda status, headers, exc_info=None: None)
+    except Exception:
+        logging.getLogger(__name__).exception('Warm-up request failed')
+
+_warm_up()
+
 def application(env, start_response):
     return api(env, start_response)
@@ -1,8 +1,21 @@
+import logging
 import clearskies
-from models import Users
-from .applications import users_api
+from wsgiref.util import setup_testing_defaults
+from applications import users_api
 
 api = clearskies.contexts.wsgi(users_api)
 
+def _warm_up():
+    # Send one throwaway request through the application as the worker starts, so that clearskies does its first-run
+    # setup now instead of during the first real request.  It only asks for a single record to keep the query cheap.
+    env = {'QUERY_STRING': 'limit=1'}
+    setup_testing_defaults(env)
+    try:
+        api(env, lambda status, headers, exc_info=None: None)
+    except Exception:
+        logging.getLogger(__name__).exception('Warm-up request failed')
+
+_warm_up()
+
 def application(env, start_response):
     return api(env, start_response)
@@ -1,5 +1,57 @@
+import threading
+import requests
+from collections import OrderedDict
+from operator import itemgetter
+from requests.adapters import HTTPAdapter
 from clearskies.column_types import Email, build_column_config
 
+
+_BANNED_DOMAIN = '@example.com'
+# (connect, read) timeouts, in seconds, for the randomuser.me lookup
+_TIMEOUT = (3.05, 10)
+
+# Shared across requests so that connections to randomuser.me are kept alive and reused.  The application
+# binds this as the `requests` dependency.
+requests_session = requests.Session()
+requests_session.mount('https://', HTTPAdapter(pool_connections=16, pool_maxsize=64))
+
+# randomuser.me always returns the same person for the same seed, so lookups are cached (LRU) per process
+_USER_DATA_CACHE_SIZE = 4096
+_user_data_cache = OrderedDict()
+_user_data_cache_lock = threading.Lock()
+
+
+# pulls all three location fields out of the response in one call
+_get_location = itemgetter('city', 'state', 'country')
+
+
+def _fetch_user_data(client, email):
+    with _user_data_cache_lock:
+        if email in _user_data_cache:
+            _user_data_cache.move_to_end(email)
+            return _user_data_cache[email]
+
+    response_data = client.get(
+        'https://randomuser.me/api/',
+        # only ask for the fields we actually use: the full record is several times larger
+        params={'seed': email, 'inc': 'location,dob', 'noinfo': ''},
+        timeout=_TIMEOUT,
+    ).json()['results'][0]
+    (city, state, country) = _get_location(response_data['location'])
+    user_data = {
+        'city': city,
+        'state': state,
+        'country': country,
+        'age': response_data['dob']['age'],
+    }
+
+    with _user_data_cache_lock:
+        _user_data_cache[email] = user_data
+        if len(_user_data_cache) > _USER_DATA_CACHE_SIZE:
+            _user_data_cache.popitem(last=False)
+    return user_data
+
+
 def business_email(name, **kwargs):
     return build_column_config(name, BusinessEmail, **kwargs)
 
@@ -9,18 +61,24 @@ class BusinessEmail(Email):
     def __init__(self, requests):
         self._requests = requests
 
+    @staticmethod
+    def clear_cache():
+        with _user_data_cache_lock:
+            _user_data_cache.clear()
+
     def input_error_for_value(self, value):
         error = super().input_error_for_value(value)
         if error:
             return error
-        if value[-12:] == '@example.com':
+        if value.endswith(_BANNED_DOMAIN):
             return 'Invalid email domain'
         return ''
 
     def pre_save(self, data, model):
-        if not self.name in data:
+        raw_email = data.get(self.name)
+        if raw_email is None:
             return data
-        email = data[self.name].strip()
+        email = raw_email.strip()
         if not email:
             user_data = {
                 'city': '',
@@ -29,18 +87,7 @@ class BusinessEmail(Email):
                 'age': 0,
             }
         else:
-            response_data = self._requests.get(
-                'https://randomuser.me/api/',
-                params={'seed': email}
-            ).json()['results'][0]
-            user_data = {
-                'city': response_data['location']['city'],
-                'state': response_data['location']['state'],
-                'country': response_data['location']['country'],
-                'age': response_data['dob']['age'],
-            }
+            user_data = _fetch_user_data(self._requests, email)
 
-        return {
-            **data,
-            **user_data,
-        }
+        data.update(user_data)
+        return data
@@ -1,5 +1,6 @@
 import clearskies
 from . import models
+from .models.business_email import requests_session
 
 users_api = clearskies.Application(
     clearskies.handlers.RestfulAPI,
@@ -11,4 +12,5 @@ users_api = clearskies.Application(
         'default_sort_column': 'name',
         'authentication': clearskies.authentication.public(),
     },
+    bindings={'requests': requests_session},
 )
@@ -5,6 +5,29 @@ from types import SimpleNamespace
 
 
 class BusinessEmailTest(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        # Mock out our requests object, including the response.  These are built once and shared by all the tests
+        cls.response = SimpleNamespace(json=lambda: {'results':[{
+            'location': {
+                'city': 'cool city',
+                'state': 'awesome state',
+                'country': 'my country',
+            },
+            'dob': {
+                'age': 20,
+            }
+        }]})
+        cls.get = MagicMock(return_value=cls.response)
+        cls.requests = SimpleNamespace(get=cls.get)
+
+    def setUp(self):
+        # forget the calls made by previous tests
+        self.get.reset_mock()
+
+        # lookups are cached across BusinessEmail objects, so start every test from a clean slate
+        BusinessEmail.clear_cache()
+
     def test_check_search_value(self):
         # Our class needs a requests object, but since we're not going to use it in the function
         # we're passing in here, we can be lazy and pass in anything we want
@@ -16,22 +39,8 @@ class BusinessEmailTest(unittest.TestCase):
         self.assertEquals('Value must be a string for email', email.check_search_value(5))
 
     def test_pre_save(self):
-        # Mock out our requests object, including the response
-        response = SimpleNamespace(json=lambda: {'results':[{
-            'location': {
-                'city': 'cool city',
-                'state': 'awesome state',
-                'country': 'my country',
-            },
-            'dob': {
-                'age': 20,
-            }
-        }]})
-        get = MagicMock(return_value=response)
-        requests = SimpleNamespace(get=get)
-
-        # now build our email object and pass in the mock
-        email = BusinessEmail(requests)
+        # build our email object and pass in the mock
+        email = BusinessEmail(self.requests)
         email.configure('email', {}, BusinessEmailTest)
 
         # and test out the pre_save!  Again, the second parameter (model) passed to pre_save won't
@@ -55,9 +64,10 @@ class BusinessEmailTest(unittest.TestCase):
         }, final_data)
 
         # and of course we should have made the correct API call to our service provider
-        get.assert_called_with(
+        self.get.assert_called_with(
             'https://randomuser.me/api/',
-            params={'seed': 'cmancone@example.com'}
+            params={'seed': 'cmancone@example.com', 'inc': 'location,dob', 'noinfo': ''},
+            timeout=(3.05, 10),
         )
 
     def test_pre_save_no_email(self):
@@ -76,6 +86,25 @@ class BusinessEmailTest(unittest.TestCase):
             'name': 'Conor',
         }, final_data)
 
+    def test_pre_save_none_email(self):
+        email = BusinessEmail(self.requests)
+        email.configure('email', {}, BusinessEmailTest)
+
+        final_data = email.pre_save(
+            {
+                'name': 'Conor',
+                'email': None,
+            },
+            'model'
+        )
+
+        # an explicit None is treated like a missing email: the data is left alone and nothing is looked up
+        self.assertEquals({
+            'name': 'Conor',
+            'email': None,
+        }, final_data)
+        self.get.assert_not_called()
+
     def test_pre_save_blank_email(self):
         email = BusinessEmail('requests')
         email.configure('email', {}, BusinessEmailTest)
@@ -101,3 +130,14 @@ class BusinessEmailTest(unittest.TestCase):
             'country': '',
             'age': 0,
         }, final_data)
+
+    def test_pre_save_cached(self):
+        email = BusinessEmail(self.requests)
+        email.configure('email', {}, BusinessEmailTest)
+
+        first = email.pre_save({'email': 'cmancone@example.com'}, 'model')
+        second = email.pre_save({'email': 'cmancone@example.com'}, 'model')
+
+        # the same email should only be looked up once
+        self.assertEquals(first, second)
+        self.assertEquals(1, self.get.call_count)
@@ -1,7 +1,21 @@
+import logging
 import clearskies
+from wsgiref.util import setup_testing_defaults
 import apps
 
 api = clearskies.contexts.wsgi(apps.users_api)
 
+def _warm_up():
+    # Send one throwaway request through the application as the worker starts, so that clearskies does its first-run
+    # setup now instead of during the first real request.  It lists a single user to keep the query cheap.
+    env = {'PATH_INFO': '/users', 'QUERY_STRING': 'limit=1'}
+    setup_testing_defaults(env)
+    try:
+        api(env, lambda status, headers, exc_info=None: None)
+    except Exception:
+        logging.getLogger(__name__).exception('Warm-up request failed')
+
+_warm_up()
+
 def application(env, start_response):
     return api(env, start_response)
@@ -1,4 +1,4 @@
-from collections import OrderedDict
+from types import MappingProxyType
 from clearskies import Model
 from clearskies.column_types import string, has_many
 from clearskies.input_requirements import required, maximum_length
@@ -6,16 +6,20 @@ from . import users
 
 
 class Status(Model):
+    _columns_cache = None
+
     def __init__(self, cursor_backend, columns):
         super().__init__(cursor_backend, columns)
 
     def columns_configuration(self):
-        return OrderedDict([
-            string('name'),
-            has_many(
-                'users',
-                child_models_class=users.Users,
-                is_readable=True,
-                readable_child_columns=['status_id', 'name', 'email'],
-            ),
-        ])
+        if Status._columns_cache is None:
+            Status._columns_cache = MappingProxyType(dict([
+                string('name'),
+                has_many(
+                    'users',
+                    child_models_class=users.Users,
+                    is_readable=True,
+                    readable_child_columns=['status_id', 'name', 'email'],
+                ),
+            ]))
+        return Status._columns_cache